@@ -1,36 +1,47 @@
 """
 Data preprocessing utilities for Turkish text analysis.
 """
-import re
+import pickle
+import string
+from pathlib import Path
+
 from zemberek.morphology import TurkishMorphology
 
+# Deletion table built once at import. str.translate runs in C without the
+# regex engine, covering ASCII punctuation plus the typographic characters
+# common in Turkish text. U+0307 is the combining dot that Python's
+# str.lower leaves behind for dotted capital İ ("İyi" -> "i̇yi"); stripping
+# it keeps roots like "iyi" matchable, as the old regex did.
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation + "«»—–…‘’“”´`¡¿\u0307")
+
 
 def preprocess_text(text):
     """
     Preprocesses text by converting to lowercase and removing special characters.
-    
+
     Args:
         text (str): Input text to preprocess
-        
+
     Returns:
         str: Preprocessed text
     """
-    text = text.lower()
-    text = re.sub(r'[^\w\s]', '', text)
-    return text
+    return text.lower().translate(_PUNCT_TABLE)
 
 
 def preprocess_txt_words(file_path, morphology):
     """
     Processes a text file containing words and reduces them to their roots using
-    morphological analysis. Creates a dictionary mapping roots to weights.
-    
+    morphological analysis.
+
+    The word files are unweighted (every entry counts as 1), so the result is
+    a frozenset of roots used purely for membership testing.
+
     Args:
         file_path: Path to the text file containing words (one per line)
         morphology: TurkishMorphology instance for morphological analysis
-        
+
     Returns:
-        dict: Dictionary mapping word roots (lowercase) to weights (default 1)
+        frozenset: Word roots (lowercase) extracted from the file
     """
     roots = set()
     try:
@@ -43,7 +54,49 @@ def preprocess_txt_words(file_path, morphology):
                         root = result.item.root
                         if root:
                             roots.add(root.lower())
-        return {root: 1 for root in roots}
+        return frozenset(roots)
     except Exception as e:
         print(f"Error processing text file: {e}")
-        return {}
+        return frozenset()
+
+
+def load_word_roots(file_path, morphology):
+    """
+    Cached wrapper around preprocess_txt_words.
+
+    Persists the extracted root set next to the word file as
+    <name>.roots.pkl, keyed by the word file's mtime. On a cache hit the
+    per-word morphological analysis (and its JVM round-trips) is skipped
+    entirely; editing the word file invalidates the cache.
+
+    Args:
+        file_path: Path to the text file containing words (one per line)
+        morphology: TurkishMorphology instance for morphological analysis
+
+    Returns:
+        frozenset: Word roots (lowercase) extracted from the file
+    """
+    source = Path(file_path)
+    cache_path = source.with_suffix(".roots.pkl")
+    try:
+        mtime = source.stat().st_mtime
+    except OSError:
+        mtime = None
+
+    if mtime is not None and cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                cached_mtime, roots = pickle.load(f)
+            if cached_mtime == mtime:
+                return roots
+        except (OSError, pickle.PickleError, ValueError):
+            pass
+
+    roots = preprocess_txt_words(file_path, morphology)
+    if mtime is not None and roots:
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump((mtime, roots), f)
+        except OSError:
+            pass
+    return roots
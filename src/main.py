@@ -1,100 +1,185 @@
 """
 Main entry point for Turkish Sentiment Analysis application.
 """
+import argparse
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
 from jpype import startJVM, shutdownJVM, isJVMStarted
 from zemberek.morphology import TurkishMorphology
-import pandas as pd
 
 from .constants import ZEMBEREK_PATH, POSITIVE_WORDS_FILE, NEGATIVE_WORDS_FILE, LABELED_SENTENCES_FILE
-from .data_preprocessing import preprocess_txt_words
+from .data_preprocessing import load_word_roots
 from .sentiment_analysis import analyze_sentiment, evaluate_model
 from .visualization import plot_performance_metrics
 
+# Process-wide morphology singleton so REPL sessions, tests and batch
+# scripts share one JVM instead of paying the multi-second boot per call
+_morphology = None
+
+
+def _shutdown_jvm():
+    if isJVMStarted():
+        shutdownJVM()
+        print("JVM shut down.")
+
+
+def get_morphology():
+    """
+    Returns the shared TurkishMorphology instance, booting the JVM once.
+
+    The first call starts the JVM with the Zemberek JAR, builds the
+    analyzer and registers JVM shutdown with atexit; later calls reuse the
+    same instance.
+
+    Returns:
+        TurkishMorphology: The process-wide morphology analyzer
+    """
+    global _morphology
+    if _morphology is None:
+        if not isJVMStarted():
+            startJVM("-Djava.class.path=" + ZEMBEREK_PATH)
+            atexit.register(_shutdown_jvm)
+        _morphology = TurkishMorphology.create_with_defaults()
+    return _morphology
+
+
+@contextmanager
+def zemberek_session():
+    """
+    Context manager yielding the shared morphology instance.
+
+    The JVM outlives the with-block (a JVM cannot be restarted within a
+    process); shutdown happens once at interpreter exit.
+
+    Yields:
+        TurkishMorphology: The process-wide morphology analyzer
+    """
+    yield get_morphology()
+
 
 def main():
     """
     Main function that runs the sentiment analysis application.
-    
+
     - Starts JVM and initializes Turkish morphology analyzer
     - Loads positive/negative word dictionaries
     - Provides interactive sentence analysis
     - Evaluates model on test dataset
     - Displays performance metrics
     """
-    try:
-        # Start JVM with Zemberek JAR
-        startJVM("-Djava.class.path=" + ZEMBEREK_PATH)
-        morphology = TurkishMorphology.create_with_defaults()
-        
-        # Load word dictionaries
-        positive_dict = preprocess_txt_words(str(POSITIVE_WORDS_FILE), morphology)
-        negative_dict = preprocess_txt_words(str(NEGATIVE_WORDS_FILE), morphology)
-
-        print("Enter sentences to analyze. Type 'q' to quit.")
-        while True:
-            user_input = input("Sentence: ").strip()
-            if user_input.lower() == 'q':
-                break
-            if user_input:
-                analysis = analyze_sentiment(
-                    sentence=user_input,
-                    morphology=morphology,
-                    positive_dict=positive_dict,
-                    negative_dict=negative_dict,
-                )
-                print(f"\nSentence: {user_input}")
-                print(f"Sentiment: {analysis['sentiment']}")
-                print(f"Confidence Score: {analysis['confidence']:.2f}")
-                if analysis['predicate_analysis']:
-                    print(f"Predicate Analysis: {analysis['predicate_analysis']}")
-                print(f"Found Features: {analysis['features']}")
-
-        # Load test data and evaluate model
-        df = pd.read_excel(str(LABELED_SENTENCES_FILE))
-        test_data = list(zip(df["Cümle"], df["Sınıf"]))
-
-        results = evaluate_model(
-            test_data=test_data,
-            morphology=morphology,
-            positive_dict=positive_dict,
-            negative_dict=negative_dict,
-        )
-
-        # Calculate performance metrics
-        total = sum(results[k] for k in ['DP', 'DN', 'YP', 'YN'])
-        accuracy = (results['DP'] + results['DN']) / total if total > 0 else 0
-        precision = results['DP'] / (results['DP'] + results['YP']) if (results['DP'] + results['YP']) > 0 else 0
-        recall = results['DP'] / (results['DP'] + results['YN']) if (results['DP'] + results['YN']) > 0 else 0
-        f1 = (2 * precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
-
-        metrics = {
-            "Accuracy": accuracy,
-            "Precision": precision,
-            "Recall": recall,
-            "F1 Score": f1
-        }
-
-        # Print performance metrics as percentages
-        print("\nPerformance Metrics (Percentage):")
-        for metric, value in metrics.items():
-            print(f"{metric}: {value * 100:.2f}%")
-
-        # Visualize performance metrics
-        plot_performance_metrics(metrics)
-
-        # Print incorrect predictions
-        print("\nIncorrect Predictions:")
-        for wp in results['wrong_predictions']:
-            print(f"  - Sentence: {wp['text']}")
-            print(f"    True Label: {wp['true_label']}")
-            print(f"    Predicted: {wp['predicted']}")
+    parser = argparse.ArgumentParser(description="Turkish sentiment analysis")
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Number of worker processes for model evaluation (default: 1, sequential)"
+    )
+    args = parser.parse_args()
 
+    try:
+        with zemberek_session() as morphology:
+            _run(morphology, args)
     except Exception as e:
         print(f"Error occurred: {e}")
-    finally:
-        if isJVMStarted():
-            shutdownJVM()
-            print("JVM shut down.")
+
+
+def _run(morphology, args):
+    """
+    Runs the interactive loop and model evaluation with a live morphology.
+
+    Args:
+        morphology: TurkishMorphology instance from zemberek_session
+        args: Parsed command-line arguments
+    """
+    # Load both word dictionaries concurrently: JPype releases the GIL
+    # during JNI calls and Zemberek's disambiguator is thread-safe, so the
+    # two analysis-heavy loads overlap on separate threads
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        positive_future = executor.submit(
+            load_word_roots, str(POSITIVE_WORDS_FILE), morphology)
+        negative_future = executor.submit(
+            load_word_roots, str(NEGATIVE_WORDS_FILE), morphology)
+        positive_roots = positive_future.result()
+        negative_roots = negative_future.result()
+
+    print("Enter sentences to analyze. Type 'q' to quit.")
+    while True:
+        user_input = input("Sentence: ").strip()
+        if user_input.lower() == 'q':
+            break
+        if user_input:
+            analysis = analyze_sentiment(
+                sentence=user_input,
+                morphology=morphology,
+                positive_roots=positive_roots,
+                negative_roots=negative_roots,
+            )
+            print(f"\nSentence: {user_input}")
+            print(f"Sentiment: {analysis['sentiment']}")
+            print(f"Confidence Score: {analysis['confidence']:.2f}")
+            if analysis['predicate_analysis']:
+                print(f"Predicate Analysis: {analysis['predicate_analysis']}")
+            print(f"Found Features: {analysis['features']}")
+
+    # pandas is only needed from this point on; importing it lazily
+    # keeps the interactive prompt snappy on startup
+    import pandas as pd
+
+    # Load test data and evaluate model. Prefer the Parquet copy produced
+    # by tools/convert_labels.py, which loads far faster than xlsx; else
+    # try the calamine engine and fall back to the default xlsx reader.
+    parquet_path = LABELED_SENTENCES_FILE.with_suffix(".parquet")
+    if parquet_path.exists():
+        df = pd.read_parquet(parquet_path)
+    else:
+        try:
+            df = pd.read_excel(str(LABELED_SENTENCES_FILE), engine="calamine")
+        except (ImportError, ValueError):
+            df = pd.read_excel(str(LABELED_SENTENCES_FILE))
+
+    # Stream (sentence, label) pairs instead of materializing a second
+    # copy of the dataset in a list
+    test_data = zip(df["Cümle"].to_numpy(), df["Sınıf"].to_numpy())
+
+    results = evaluate_model(
+        test_data=test_data,
+        morphology=morphology,
+        positive_roots=positive_roots,
+        negative_roots=negative_roots,
+        jobs=args.jobs,
+        zemberek_path=ZEMBEREK_PATH,
+        positive_words_file=str(POSITIVE_WORDS_FILE),
+        negative_words_file=str(NEGATIVE_WORDS_FILE),
+    )
+
+    # Calculate performance metrics
+    total = sum(results[k] for k in ['DP', 'DN', 'YP', 'YN'])
+    accuracy = (results['DP'] + results['DN']) / total if total > 0 else 0
+    precision = results['DP'] / (results['DP'] + results['YP']) if (results['DP'] + results['YP']) > 0 else 0
+    recall = results['DP'] / (results['DP'] + results['YN']) if (results['DP'] + results['YN']) > 0 else 0
+    f1 = (2 * precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
+
+    metrics = {
+        "Accuracy": accuracy,
+        "Precision": precision,
+        "Recall": recall,
+        "F1 Score": f1
+    }
+
+    # Print performance metrics as percentages
+    print("\nPerformance Metrics (Percentage):")
+    for metric, value in metrics.items():
+        print(f"{metric}: {value * 100:.2f}%")
+
+    # Visualize performance metrics
+    plot_performance_metrics(metrics)
+
+    # Print incorrect predictions
+    print("\nIncorrect Predictions:")
+    for wp in results['wrong_predictions']:
+        print(f"  - Sentence: {wp['text']}")
+        print(f"    True Label: {wp['true_label']}")
+        print(f"    Predicted: {wp['predicted']}")
 
 
 if __name__ == "__main__":
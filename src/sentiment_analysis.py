@@ -1,26 +1,413 @@
 """
 Sentiment analysis module using rule-based approach with Zemberek morphological analysis.
 """
-from collections import defaultdict
-from zemberek.tokenization import TurkishTokenizer
+from functools import lru_cache
+from itertools import islice
+from multiprocessing import get_context
+
+import numpy as np
+from numba import njit
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 from .data_preprocessing import preprocess_text
 
+# Per-process token analyzer cache. Created lazily for the morphology instance
+# in use so cached entries survive across analyze_sentiment calls.
+_token_analyzer = None
+_token_analyzer_morphology = None
+
+
+def get_token_analyzer(morphology):
+    """
+    Returns an LRU-cached per-token analyzer bound to the given morphology.
+
+    Repeated surface forms across sentences hit the Python-side cache instead
+    of crossing the JVM boundary again, which dominates wall time when
+    evaluating many sentences with heavy word overlap. Cached entries are
+    plain Python tuples (see _convert_analysis) so they do not retain JVM
+    proxy objects.
+
+    Args:
+        morphology: TurkishMorphology instance for morphological analysis
+
+    Returns:
+        callable: Function mapping a token string to a tuple of converted
+            analysis tuples, one per best analysis
+    """
+    global _token_analyzer, _token_analyzer_morphology
+    if _token_analyzer is None or _token_analyzer_morphology is not morphology:
+        @lru_cache(maxsize=100_000)
+        def _analyze_token(token):
+            analyses = morphology.analyze_and_disambiguate(token).best_analysis()
+            return tuple(_convert_analysis(result) for result in analyses)
+
+        _token_analyzer = _analyze_token
+        _token_analyzer_morphology = morphology
+    return _token_analyzer
+
+
+def _convert_analysis(result):
+    """
+    Converts a Zemberek SingleAnalysis into a plain Python tuple.
+
+    Verb detection scans the structured morpheme ids instead of
+    substring-matching str(result), so the full analysis string is only
+    materialized for verbs (where it is shown to the user as the predicate
+    analysis). A "Verb" morpheme anywhere in the chain counts, which keeps
+    zero-derived copular predicates ("harikaydı", Adjective|Zero→Verb)
+    detected like the original string scan did.
+
+    Args:
+        result: A Zemberek SingleAnalysis object
+
+    Returns:
+        tuple: (root_lower, is_verb, has_negation, analysis_str)
+    """
+    item = result.item
+    root = item.root or item.normalized_form
+    root = str(root).lower() if root else ""
+
+    is_verb = False
+    has_negation = False
+    for morpheme in result.get_morphemes():
+        morpheme_id = str(morpheme.id_)
+        if morpheme_id == "Verb":
+            is_verb = True
+        elif morpheme_id == "Neg":
+            has_negation = True
+    analysis_str = str(result) if is_verb else ""
+    return (root, is_verb, has_negation, analysis_str)
+
+
+def build_lexicon(positive_roots, negative_roots):
+    """
+    Merges the positive and negative root sets into one signed lexicon.
+
+    Positive roots map to +1 and negative roots to -1, so the scoring loop
+    needs a single dictionary lookup per root instead of two membership
+    tests. Roots present in both lists count as positive, matching the
+    original scoring loop's if-positive-elif-negative precedence.
+
+    Args:
+        positive_roots (frozenset): Positive word roots
+        negative_roots (frozenset): Negative word roots
+
+    Returns:
+        dict: Mapping of root to signed weight (+1 positive, -1 negative)
+    """
+    lexicon = {root: -1 for root in negative_roots}
+    for root in positive_roots:
+        lexicon[root] = 1
+    return lexicon
+
+
+# Merged lexicon cache, rebuilt only when the source root sets change.
+# Holds (root_ids, weights, miss_id): a root -> int id map plus an int8
+# weight array indexed by id, so scoring can run on integers instead of
+# strings. The trailing weights slot is 0 and miss_id points at it, so
+# unmatched roots contribute nothing without needing a branch.
+_lexicon_state = None
+_lexicon_sources = None
+
+
+def _get_lexicon_state(positive_roots, negative_roots):
+    global _lexicon_state, _lexicon_sources
+    # Hold the root sets themselves: keying on id() alone could serve stale
+    # state if an old set is garbage-collected and its id reused
+    if (_lexicon_state is None
+            or _lexicon_sources[0] is not positive_roots
+            or _lexicon_sources[1] is not negative_roots):
+        lexicon = build_lexicon(positive_roots, negative_roots)
+        root_ids = {root: i for i, root in enumerate(lexicon)}
+        weights = np.zeros(len(lexicon) + 1, dtype=np.int8)
+        for root, weight in lexicon.items():
+            weights[root_ids[root]] = weight
+        _lexicon_state = (root_ids, weights, len(lexicon))
+        _lexicon_sources = (positive_roots, negative_roots)
+    return _lexicon_state
+
+
+# Aho-Corasick prefilter cache, rebuilt alongside the lexicon state
+_prefilter = None
+_prefilter_sources = None
+
+# Final-consonant softening before vowel-initial suffixes (kitap -> kitabı,
+# umut -> umudu, git -> gidiyor)
+_FINAL_MUTATIONS = {"p": "b", "ç": "c", "t": "d", "k": "ğ"}
+
+_VOWELS = "aeıioöuü"
+
+
+def _root_variants(root):
+    """
+    Returns surface-form variants a root can take through morphophonology.
+
+    Turkish roots often are not substrings of their inflected forms: the
+    final consonant softens before vowel-initial suffixes and some roots
+    drop their last vowel (burun -> burnu). The prefilter automaton indexes
+    these variants alongside the bare root so such sentences are not
+    misjudged as neutral.
+
+    Args:
+        root (str): A lexicon root (lowercase)
+
+    Returns:
+        set: The root plus its mutated/vowel-drop variants
+    """
+    variants = {root}
+    if root and root[-1] in _FINAL_MUTATIONS:
+        variants.add(root[:-1] + _FINAL_MUTATIONS[root[-1]])
+    # Last-syllable narrow-vowel drop in disyllabic roots: burun -> burn-,
+    # alın -> aln-
+    if (len(root) >= 4 and root[-2] in "ıiuü"
+            and root[-1] not in _VOWELS):
+        variants.add(root[:-2] + root[-1])
+    return variants
+
+
+def _get_prefilter(positive_roots, negative_roots):
+    """
+    Returns an Aho-Corasick automaton over all lexicon roots, or None.
 
-def analyze_sentiment(sentence, morphology, positive_dict, negative_dict):
+    The automaton indexes each root plus its _root_variants surface forms;
+    a sentence containing none of them cannot match a sentiment word after
+    morphological analysis, so it acts as a cheap pre-filter that lets
+    clearly-neutral sentences skip Zemberek entirely. Requires
+    pyahocorasick; without it the filter is disabled and every sentence is
+    fully analyzed.
+
+    Args:
+        positive_roots (frozenset): Positive word roots
+        negative_roots (frozenset): Negative word roots
+
+    Returns:
+        ahocorasick.Automaton or None
+    """
+    global _prefilter, _prefilter_sources
+    if ahocorasick is None:
+        return None
+    if (_prefilter is None
+            or _prefilter_sources[0] is not positive_roots
+            or _prefilter_sources[1] is not negative_roots):
+        automaton = ahocorasick.Automaton()
+        for root in positive_roots:
+            for variant in _root_variants(root):
+                automaton.add_word(variant, variant)
+        for root in negative_roots:
+            for variant in _root_variants(root):
+                automaton.add_word(variant, variant)
+        automaton.make_automaton()
+        _prefilter = automaton
+        _prefilter_sources = (positive_roots, negative_roots)
+    return _prefilter
+
+
+@njit(cache=True)
+def _score_ids(ids, weights, multiplier):
+    """
+    Sums the signed weights of the root ids (misses map to a zero weight).
+    """
+    score = 0
+    for i in ids:
+        score += weights[i]
+    return score * multiplier
+
+
+def _find_predicate(results):
+    """
+    Finds the rightmost verbal analysis in a sentence.
+
+    Turkish predicates typically sit at the end of the sentence, so the scan
+    runs in reverse and stops at the first verb. The verb and negation flags
+    were precomputed on the Java side by _convert_analysis, so this touches
+    only plain Python tuples.
+
+    Args:
+        results: List of _convert_analysis tuples for the sentence
+
+    Returns:
+        dict or None: Predicate info (root, is_negative, full_analysis),
+            or None if the sentence contains no verb
+    """
+    for root, is_verb, has_negation, analysis_str in reversed(results):
+        if is_verb:
+            return {
+                'root': root,
+                'is_negative': has_negation,
+                'full_analysis': analysis_str
+            }
+    return None
+
+
+def _score_analyses(results, num_tokens, positive_roots, negative_roots):
+    """
+    Scores a sentence from its converted (root, morphemes) analysis tuples.
+
+    Applies the heuristic predicate-based negation detection and matches
+    roots against the positive/negative root sets.
+
+    Args:
+        results: List of _convert_analysis tuples for the sentence
+        num_tokens (int): Token count used as the confidence denominator
+        positive_roots (frozenset): Positive word roots
+        negative_roots (frozenset): Negative word roots
+
+    Returns:
+        dict: Analysis result (same shape as analyze_sentiment's return value)
+    """
+    # Heuristic negation detection through predicate analysis
+    # This is a rule-based approach that checks for negation markers in verbs
+    predicate_info = _find_predicate(results)
+    predicate_multiplier = -1 if predicate_info and predicate_info['is_negative'] else 1
+
+    # Map each root to its integer lexicon id and fold the score in the
+    # JIT-compiled kernel
+    root_ids, weights, miss_id = _get_lexicon_state(positive_roots, negative_roots)
+    id_get = root_ids.get
+    ids = np.fromiter((id_get(entry[0], miss_id) for entry in results),
+                      dtype=np.int64, count=len(results))
+    score = int(_score_ids(ids, weights, predicate_multiplier))
+
+    confidence = 0
+    positive_words = []
+    negative_words = []
+    for entry, root_id in zip(results, ids):
+        if root_id != miss_id:
+            confidence += 1
+            if weights[root_id] > 0:
+                positive_words.append(entry[0])
+            else:
+                negative_words.append(entry[0])
+
+    return _build_result(score, confidence, num_tokens,
+                         positive_words, negative_words, predicate_info)
+
+
+def _build_result(score, confidence, num_tokens,
+                  positive_words, negative_words, predicate_info):
+    """
+    Assembles the analysis result dict shared by the scalar and batch paths.
+
+    Args:
+        score (int): Signed sentiment score after negation handling
+        confidence (int): Number of matched sentiment-bearing roots
+        num_tokens (int): Token count used as the confidence denominator
+        positive_words (list): Matched positive roots
+        negative_words (list): Matched negative roots
+        predicate_info (dict or None): Output of _find_predicate
+
+    Returns:
+        dict: Analysis result (same shape as analyze_sentiment's return value)
+    """
+    found_features = {}
+    if predicate_info:
+        found_features['predicate'] = [{
+            'root': predicate_info['root'],
+            'is_negative': predicate_info['is_negative'],
+            'analysis': predicate_info['full_analysis']
+        }]
+    if positive_words:
+        found_features['positive_words'] = positive_words
+    if negative_words:
+        found_features['negative_words'] = negative_words
+
+    # Calculate confidence score
+    confidence_score = confidence / num_tokens if num_tokens else 0
+
+    # Determine sentiment based on score
+    if score > 0:
+        sentiment = "Positive"
+    elif score < 0:
+        sentiment = "Negative"
+    else:
+        sentiment = "Neutral"
+
+    return {
+        'sentiment': sentiment,
+        'score': score,
+        'confidence': confidence_score,
+        'features': found_features,
+        'predicate_analysis': predicate_info
+    }
+
+
+def _score_batch(per_sentence, num_tokens_list, positive_roots, negative_roots):
+    """
+    Scores a batch of converted sentences in one vectorized pass.
+
+    All root ids are flattened into a single array with per-sentence
+    offsets, so the numeric reduction runs as np.add.reduceat over the
+    whole batch instead of a Python loop per sentence. Each sentence gets
+    a trailing miss id, keeping every reduceat segment non-empty (an empty
+    segment would otherwise leak its neighbour's first element).
+
+    Args:
+        per_sentence: List of per-sentence _convert_analysis tuple lists
+        num_tokens_list: Token count per sentence (confidence denominators)
+        positive_roots (frozenset): Positive word roots
+        negative_roots (frozenset): Negative word roots
+
+    Returns:
+        list: One analysis dict per sentence, in input order
+    """
+    if not per_sentence:
+        return []
+
+    root_ids, weights, miss_id = _get_lexicon_state(positive_roots, negative_roots)
+    id_get = root_ids.get
+
+    offsets = np.empty(len(per_sentence), dtype=np.int64)
+    flat = []
+    for i, results in enumerate(per_sentence):
+        offsets[i] = len(flat)
+        flat.extend(id_get(entry[0], miss_id) for entry in results)
+        flat.append(miss_id)
+    ids_flat = np.array(flat, dtype=np.int64)
+    seg_weights = weights[ids_flat]
+
+    predicates = [_find_predicate(results) for results in per_sentence]
+    multipliers = np.fromiter(
+        ((-1 if info and info['is_negative'] else 1) for info in predicates),
+        dtype=np.int64, count=len(predicates))
+
+    seg_scores = np.add.reduceat(seg_weights, offsets) * multipliers
+    hit_counts = np.add.reduceat((seg_weights != 0).astype(np.int64), offsets)
+
+    outputs = []
+    for i, (results, predicate_info) in enumerate(zip(per_sentence, predicates)):
+        positive_words = []
+        negative_words = []
+        base = int(offsets[i])
+        for j, entry in enumerate(results):
+            weight = seg_weights[base + j]
+            if weight > 0:
+                positive_words.append(entry[0])
+            elif weight < 0:
+                negative_words.append(entry[0])
+        outputs.append(_build_result(
+            int(seg_scores[i]), int(hit_counts[i]), num_tokens_list[i],
+            positive_words, negative_words, predicate_info))
+    return outputs
+
+
+def analyze_sentiment(sentence, morphology, positive_roots, negative_roots):
     """
     Analyzes the sentiment of a Turkish sentence using a rule-based approach.
-    
+
     The method uses morphological analysis to extract word roots and matches them
-    against positive/negative word dictionaries. It also handles negation through
+    against positive/negative root sets. It also handles negation through
     predicate (verb) analysis using a heuristic approach.
-    
+
     Args:
         sentence (str): The Turkish sentence to analyze
         morphology: TurkishMorphology instance for morphological analysis
-        positive_dict (dict): Dictionary of positive word roots with weights
-        negative_dict (dict): Dictionary of negative word roots with weights
-        
+        positive_roots (frozenset): Positive word roots
+        negative_roots (frozenset): Negative word roots
+
     Returns:
         dict: Analysis result containing:
             - sentiment (str): "Positive", "Negative", or "Neutral"
@@ -30,77 +417,26 @@ def analyze_sentiment(sentence, morphology, positive_dict, negative_dict):
             - predicate_analysis (dict): Predicate analysis info if found
     """
     try:
-        sentence = preprocess_text(sentence)
-        raw_tokens = TurkishTokenizer.DEFAULT.tokenize(sentence)
-        tokens = [t.content.lower() for t in raw_tokens if t.content.strip() != '']
-        
-        # Perform morphological analysis once
-        results = morphology.analyze_and_disambiguate(" ".join(tokens)).best_analysis()
-        
-        # Heuristic negation detection through predicate analysis
-        # This is a rule-based approach that checks for negation markers in verbs
-        predicate_multiplier = 1
-        predicate_info = None
-        
-        # Search for verbs in reverse order (typically at the end of sentence)
-        for analysis in reversed(results):
-            morphemes = str(analysis)
-            if 'Verb' in morphemes:
-                has_negation = 'Neg' in morphemes
-                predicate_info = {
-                    'root': analysis.item.root,
-                    'is_negative': has_negation,
-                    'full_analysis': str(analysis)
-                }
-                # Apply negation multiplier if negation marker found
-                if has_negation:
-                    predicate_multiplier = -1 * predicate_multiplier
-                break
+        # preprocess_text already lowercases and strips punctuation, so a
+        # plain whitespace split yields the same tokens as the Zemberek
+        # tokenizer without another JVM round-trip
+        text = preprocess_text(sentence)
+        tokens = text.split()
 
-        score = 0
-        confidence = 0
-        found_features = defaultdict(list)
-
-        # Add predicate information if found
-        if predicate_info:
-            found_features['predicate'] = [{
-                'root': predicate_info['root'],
-                'is_negative': predicate_info['is_negative'],
-                'analysis': predicate_info['full_analysis']
-            }]
-
-        # Analyze each word in the sentence
-        for result in results:
-            root = result.item.root or result.item.normalized_form
-            root = root.lower() if root else ""
-            
-            if root in positive_dict:
-                score += positive_dict[root] * predicate_multiplier
-                confidence += 1
-                found_features['positive_words'].append(root)
-            elif root in negative_dict:
-                score += negative_dict[root] * predicate_multiplier * -1
-                confidence += 1
-                found_features['negative_words'].append(root)
-
-        # Calculate confidence score
-        confidence_score = confidence / len(tokens) if tokens else 0
-        
-        # Determine sentiment based on score
-        if score > 0:
-            sentiment = "Positive"
-        elif score < 0:
-            sentiment = "Negative"
-        else:
-            sentiment = "Neutral"
+        # If no lexicon root occurs anywhere in the surface text, the
+        # sentence cannot score and morphological analysis can be skipped
+        automaton = _get_prefilter(positive_roots, negative_roots)
+        if automaton is not None and next(automaton.iter(text), None) is None:
+            return _build_result(0, 0, len(tokens), [], [], None)
 
-        return {
-            'sentiment': sentiment,
-            'score': score,
-            'confidence': confidence_score,
-            'features': dict(found_features),
-            'predicate_analysis': predicate_info
-        }
+        # Analyze per token through the LRU cache so repeated surface forms
+        # never cross the JVM boundary twice
+        analyze_token = get_token_analyzer(morphology)
+        results = []
+        for token in tokens:
+            results.extend(analyze_token(token))
+
+        return _score_analyses(results, len(tokens), positive_roots, negative_roots)
     except Exception as e:
         print(f"Error during sentiment analysis: {e}")
         return {
@@ -112,16 +448,208 @@ def analyze_sentiment(sentence, morphology, positive_dict, negative_dict):
         }
 
 
-def evaluate_model(test_data, morphology, positive_dict, negative_dict):
+# Sentinel token used to separate sentences in batched analysis. It contains
+# only word characters, so preprocess_text leaves it untouched.
+_BATCH_DELIMITER = "xsentx"
+
+# Number of sentences analyzed per JVM crossing in evaluate_model
+_BATCH_SIZE = 64
+
+
+def analyze_sentiment_batch(sentences, morphology, positive_roots, negative_roots):
+    """
+    Analyzes a batch of sentences with a single morphological analysis call.
+
+    The sentences are joined with a sentinel token and disambiguated in one
+    analyze_and_disambiguate call, amortizing the JVM-boundary cost over the
+    whole batch. The result is split back per sentence at the sentinel and
+    scored with the same logic as analyze_sentiment.
+
+    Args:
+        sentences: List of Turkish sentences to analyze
+        morphology: TurkishMorphology instance for morphological analysis
+        positive_roots (frozenset): Positive word roots
+        negative_roots (frozenset): Negative word roots
+
+    Returns:
+        list: One analysis dict per input sentence, in input order
+    """
+    try:
+        preprocessed = [preprocess_text(s) for s in sentences]
+
+        # Pre-filter: only sentences containing at least one lexicon root
+        # in their surface text are worth a morphological analysis
+        automaton = _get_prefilter(positive_roots, negative_roots)
+        if automaton is not None:
+            selected = [i for i, text in enumerate(preprocessed)
+                        if next(automaton.iter(text), None) is not None]
+        else:
+            selected = list(range(len(preprocessed)))
+
+        per_selected = []
+        if selected:
+            joined = f" {_BATCH_DELIMITER} ".join(preprocessed[i] for i in selected)
+            analyses = morphology.analyze_and_disambiguate(joined).best_analysis()
+
+            # Split the flat analysis list back into per-sentence sub-lists,
+            # converting to plain tuples along the way. The sentinel is an
+            # unknown word to Zemberek (its root comes back as "UNK"), so it
+            # must be recognized by its surface form, not its root.
+            per_selected = [[]]
+            for analysis in analyses:
+                if str(analysis.surface_form()) == _BATCH_DELIMITER:
+                    per_selected.append([])
+                else:
+                    per_selected[-1].append(_convert_analysis(analysis))
+
+        if len(per_selected) != len(selected):
+            # Delimiter/sentence count mismatch would misalign every result
+            # in the batch; analyze the affected sentences individually
+            print(f"Warning: batch delimiter mismatch "
+                  f"({len(per_selected)} segments for {len(selected)} sentences); "
+                  f"falling back to per-sentence analysis")
+            scored = [
+                analyze_sentiment(sentences[i], morphology,
+                                  positive_roots, negative_roots)
+                for i in selected
+            ]
+        else:
+            scored = _score_batch(
+                per_selected, [len(preprocessed[i].split()) for i in selected],
+                positive_roots, negative_roots)
+
+        # Reassemble in input order; filtered-out sentences are Neutral
+        outputs = [None] * len(sentences)
+        for i, result in zip(selected, scored):
+            outputs[i] = result
+        for i, result in enumerate(outputs):
+            if result is None:
+                outputs[i] = _build_result(
+                    0, 0, len(preprocessed[i].split()), [], [], None)
+        return outputs
+    except Exception as e:
+        print(f"Error during batched sentiment analysis: {e}")
+        return [{
+            'sentiment': "Error",
+            'score': 0,
+            'confidence': 0,
+            'features': {},
+            'predicate_analysis': None
+        } for _ in sentences]
+
+
+# Worker-process state set up once per process by _init_worker
+_worker_state = None
+
+
+def _init_worker(zemberek_path, positive_words_file, negative_words_file):
+    """
+    Initializer for evaluation worker processes.
+
+    A running JVM does not survive fork, so each worker starts its own JVM
+    and rebuilds the word dictionaries from the source files.
+
+    Args:
+        zemberek_path (str): Path to the Zemberek JAR file
+        positive_words_file (str): Path to the positive words file
+        negative_words_file (str): Path to the negative words file
+    """
+    global _worker_state
+    from jpype import startJVM, isJVMStarted
+    from zemberek.morphology import TurkishMorphology
+
+    from .data_preprocessing import load_word_roots
+
+    if not isJVMStarted():
+        startJVM("-Djava.class.path=" + zemberek_path)
+    morphology = TurkishMorphology.create_with_defaults()
+    positive_roots = load_word_roots(positive_words_file, morphology)
+    negative_roots = load_word_roots(negative_words_file, morphology)
+    _worker_state = (morphology, positive_roots, negative_roots)
+
+
+def _eval_one(item):
+    """
+    Analyzes a single (sentence, true_label) pair inside a worker process.
+
+    Args:
+        item: Tuple of (sentence, true_label)
+
+    Returns:
+        tuple: (sentence, true_label, analysis dict)
+    """
+    sentence, true_label = item
+    morphology, positive_roots, negative_roots = _worker_state
+    analysis = analyze_sentiment(sentence, morphology, positive_roots, negative_roots)
+    return sentence, true_label, analysis
+
+
+# (prediction, normalized true_label) -> confusion-matrix counter. Neutral
+# counts as incorrect for binary classification. Labels are stripped and
+# casefolded before lookup, since the dataset mixes spellings like
+# "Pozitif"/"pozitif" and carries stray whitespace.
+_TRANSITIONS = {
+    ("Positive", "pozitif"): "DP",
+    ("Negative", "negatif"): "DN",
+    ("Positive", "negatif"): "YP",
+    ("Negative", "pozitif"): "YN",
+    ("Neutral", "pozitif"): "YN",
+    ("Neutral", "negatif"): "YP",
+}
+
+
+def _record_prediction(results, sentence, true_label, analysis):
+    """
+    Folds a single prediction into the aggregated evaluation results.
+
+    Args:
+        results (dict): Aggregated results dict (mutated in place)
+        sentence (str): The evaluated sentence
+        true_label (str): Ground-truth label ("Pozitif" or "Negatif")
+        analysis (dict): Output of analyze_sentiment for the sentence
+    """
+    prediction = analysis['sentiment']
+
+    counter = _TRANSITIONS.get((prediction, str(true_label).strip().casefold()))
+    if counter is not None:
+        results[counter] += 1
+        if counter in ("YP", "YN"):
+            results['wrong_predictions'].append({
+                'text': sentence,
+                'true_label': true_label,
+                'predicted': prediction,
+                'confidence': analysis['confidence']
+            })
+
+    results['predictions'].append({
+        'text': sentence,
+        'true_label': true_label,
+        'predicted': prediction,
+        'confidence': analysis['confidence'],
+        'features': analysis['features']
+    })
+
+
+def evaluate_model(test_data, morphology, positive_roots, negative_roots,
+                   jobs=1, zemberek_path=None,
+                   positive_words_file=None, negative_words_file=None):
     """
     Evaluates the sentiment analysis model on test data.
-    
+
+    Sentences are independent, so with jobs > 1 the evaluation is spread
+    over a multiprocessing Pool. Each worker boots its own JVM and rebuilds
+    the root sets in its initializer; the parent only aggregates counters.
+
     Args:
-        test_data: List of tuples (sentence, true_label)
+        test_data: Iterable of (sentence, true_label) pairs, consumed lazily
         morphology: TurkishMorphology instance
-        positive_dict (dict): Dictionary of positive word roots
-        negative_dict (dict): Dictionary of negative word roots
-        
+        positive_roots (frozenset): Positive word roots
+        negative_roots (frozenset): Negative word roots
+        jobs (int): Number of worker processes (1 = sequential)
+        zemberek_path (str): Path to the Zemberek JAR (required for jobs > 1)
+        positive_words_file (str): Positive words file path (required for jobs > 1)
+        negative_words_file (str): Negative words file path (required for jobs > 1)
+
     Returns:
         dict: Evaluation results containing:
             - DP: True Positives (Correct Positive predictions)
@@ -139,50 +667,30 @@ def evaluate_model(test_data, morphology, positive_dict, negative_dict):
         'predictions': [],
         'wrong_predictions': []
     }
-    
-    for sentence, true_label in test_data:
-        analysis = analyze_sentiment(sentence, morphology, positive_dict, negative_dict)
-        prediction = analysis['sentiment']
-
-        if prediction == "Positive" and true_label == "Pozitif":
-            results['DP'] += 1
-        elif prediction == "Negative" and true_label == "Negatif":
-            results['DN'] += 1
-        elif prediction == "Positive" and true_label == "Negatif":
-            results['YP'] += 1
-            results['wrong_predictions'].append({
-                'text': sentence,
-                'true_label': true_label,
-                'predicted': prediction,
-                'confidence': analysis['confidence']
-            })
-        elif prediction == "Negative" and true_label == "Pozitif":
-            results['YN'] += 1
-            results['wrong_predictions'].append({
-                'text': sentence,
-                'true_label': true_label,
-                'predicted': prediction,
-                'confidence': analysis['confidence']
-            })
-        elif prediction == "Neutral":
-            # Handle neutral predictions (count as incorrect for binary classification)
-            if true_label == "Pozitif":
-                results['YN'] += 1
-            else:
-                results['YP'] += 1
-            results['wrong_predictions'].append({
-                'text': sentence,
-                'true_label': true_label,
-                'predicted': prediction,
-                'confidence': analysis['confidence']
-            })
 
-        results['predictions'].append({
-            'text': sentence,
-            'true_label': true_label,
-            'predicted': prediction,
-            'confidence': analysis['confidence'],
-            'features': analysis['features']
-        })
-    
+    if jobs > 1:
+        # Spawned workers start with a clean interpreter: forked children
+        # would inherit the parent's started-JVM flag and skip the JVM boot
+        # in _init_worker, then crash against the dead forked JVM
+        ctx = get_context("spawn")
+        with ctx.Pool(processes=jobs, initializer=_init_worker,
+                      initargs=(zemberek_path, positive_words_file, negative_words_file)) as pool:
+            for sentence, true_label, analysis in pool.imap_unordered(
+                    _eval_one, test_data, chunksize=64):
+                _record_prediction(results, sentence, true_label, analysis)
+    else:
+        # Batch sentences so each JVM crossing is amortized over _BATCH_SIZE
+        # sentences instead of paying the boundary cost per sentence. islice
+        # keeps test_data streamable (it may be a lazy iterator).
+        it = iter(test_data)
+        while True:
+            batch = list(islice(it, _BATCH_SIZE))
+            if not batch:
+                break
+            sentences = [sentence for sentence, _ in batch]
+            analyses = analyze_sentiment_batch(sentences, morphology,
+                                               positive_roots, negative_roots)
+            for (sentence, true_label), analysis in zip(batch, analyses):
+                _record_prediction(results, sentence, true_label, analysis)
+
     return results
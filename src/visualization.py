@@ -1,16 +1,18 @@
 """
 Visualization utilities for sentiment analysis results.
 """
-import matplotlib.pyplot as plt
-
-
 def plot_performance_metrics(metrics):
     """
     Creates a bar chart visualization of performance metrics.
-    
+
+    matplotlib is imported lazily so its backend initialization is only
+    paid when a plot is actually drawn, not on every application start.
+
     Args:
         metrics (dict): Dictionary mapping metric names to values (0-1 range)
     """
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(8, 6))
     plt.bar(metrics.keys(), metrics.values(), width=0.5)
     plt.ylim(0, 1)
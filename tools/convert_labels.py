@@ -0,0 +1,35 @@
+"""
+One-time conversion of the labeled sentences dataset to Parquet.
+
+Reading labeled_sentences.xlsx through openpyxl takes seconds on every
+run, while pd.read_parquet loads the same data in tens of milliseconds.
+Run this script once after changing the xlsx; main prefers the Parquet
+file whenever it exists next to the xlsx.
+
+Usage (from the project root):
+    python tools/convert_labels.py
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Make the project root importable when the script is run directly
+# (sys.path[0] is tools/, not the project root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.constants import LABELED_SENTENCES_FILE
+
+
+def main():
+    """
+    Reads the labeled xlsx dataset and writes it as Parquet alongside it.
+    """
+    target = LABELED_SENTENCES_FILE.with_suffix(".parquet")
+    df = pd.read_excel(str(LABELED_SENTENCES_FILE))
+    df.to_parquet(target, index=False)
+    print(f"Wrote {len(df)} rows to {target}")
+
+
+if __name__ == "__main__":
+    main()